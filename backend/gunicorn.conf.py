@@ -0,0 +1,15 @@
+import os
+
+# gevent workers: a request waiting on the database yields to the others
+# instead of holding the whole worker
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+worker_connections = int(os.environ.get("WORKER_CONNECTIONS", 200))
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C driver that gevent cannot patch; make it cooperative
+    from psycogreen.gevent import patch_psycopg
+
+    patch_psycopg()